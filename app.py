@@ -3,16 +3,30 @@ Roomify Dynamic Pricing Dashboard
 A comprehensive tool for hotel revenue optimization through intelligent pricing strategies.
 """
 
+import os
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, date
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
+
+# plotly.graph_objects and make_subplots are imported lazily inside the
+# functions that build figures - only some pages need them, and skipping
+# the import cuts cold-start time for the rest
+
+# Serialize figures with orjson when available - several times faster than
+# the default encoder, and it runs on every st.plotly_chart call
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
 
 # Import our custom modules
 from utils.data_prep import load_dataset
-from utils.pricing_model import train_pricing_model, DemandPredictor, RevenueOptimizer, PricingInsights
+from utils.duck import coverage_summary
+from utils.pricing_model import train_pricing_model, warm_numba_kernels, DemandPredictor, RevenueOptimizer, PricingInsights
 from utils.visualization import PricingVisualizer
 
 # Page configuration
@@ -24,7 +38,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling (dark mode compatible)
-st.markdown("""
+_CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -48,6 +62,11 @@ st.markdown("""
         margin: 0.5rem 0;
         color: var(--text-color);
     }
+    .kpi-grid {
+        display: grid;
+        grid-template-columns: repeat(3, 1fr);
+        gap: 0.5rem 1rem;
+    }
     .insight-box {
         background-color: rgba(23, 162, 184, 0.1);
         padding: 1rem;
@@ -93,41 +112,215 @@ st.markdown("""
         }
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-@st.cache_data
-def load_data():
-    """Load and cache the pricing dataset."""
-    try:
+@st.cache_resource
+def _inject_css():
+    """Send the stylesheet once per session; cached reruns replay the element."""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+    return True
+
+def _load_dataframe():
+    """Load the pricing dataset with the Parquet cache and downcast dtypes."""
+    # Prefer the Parquet copy - columnar, typed and much faster to parse
+    # than CSV. It is written once from the CSV on first load.
+    parquet_path = 'sample_data/pricing_data.parquet'
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path)
+    else:
         df = load_dataset()
-        return df
+        df.to_parquet(parquet_path, compression='zstd')
+    # Downcast to float32/category - the KPI and chart scans are
+    # memory-bound, so halving column width roughly halves their cost
+    df = df.astype({
+        'Roomify_Price': 'float32',
+        'Competitor_Price': 'float32',
+        'Occupancy_Percentage': 'float32',
+        'Revenue': 'float32',
+        'RevPAR': 'float32',
+        'Season': 'category',
+        'Day_of_Week': 'category'
+    })
+    # Compute the price premium once at ingestion; the competitive chart
+    # then reads the column instead of re-deriving it on every call
+    if 'Price_Diff' not in df.columns:
+        df['Price_Diff'] = df['Roomify_Price'] - df['Competitor_Price']
+    return df
+
+@st.cache_resource
+def load_app_bundle():
+    """Load the dataset and train the pricing models once per process.
+
+    A single cached pipeline avoids hashing the DataFrame for a second
+    cache lookup and ties the data and model lifetimes together.
+    """
+    try:
+        df = _load_dataframe()
     except FileNotFoundError:
         st.error("Dataset not found. Please ensure sample_data/pricing_data.csv exists.")
-        return None
+        return None, None, None, None, None
 
-@st.cache_resource
-def load_models():
-    """Load and cache the pricing models."""
     try:
-        df = load_data()
-        if df is not None:
-            predictor, optimizer, insights, metrics = train_pricing_model(df)
-            return predictor, optimizer, insights, metrics
-        return None, None, None, None
+        predictor, optimizer, insights, metrics = train_pricing_model(df)
+        # Compile the Numba kernels while the models are being cached so
+        # the first user click doesn't pay the JIT cost
+        warm_numba_kernels()
+        return df, predictor, optimizer, insights, metrics
     except Exception as e:
         st.error(f"Error loading models: {str(e)}")
-        return None, None, None, None
+        return df, None, None, None, None
+
+# Display formats for the scenario result tables
+_TABLE_FORMATS = {
+    'competitor_price': '${:.0f}',
+    'optimal_roomify_price': '${:.0f}',
+    'optimal_price': '${:.0f}',
+    'max_revenue': '${:,.0f}',
+    'optimal_bookings': '{:.0f}',
+    'occupancy': '{:.1f}%'
+}
+
+def _format_table(df):
+    """Pre-format numeric columns as strings.
+
+    Cheaper than pandas Styler (which renders a Jinja template per cell)
+    for the tiny tables shown in the scenario explorers.
+    """
+    out = df.copy()
+    for col, fmt in _TABLE_FORMATS.items():
+        if col in out.columns:
+            out[col] = out[col].map(fmt.format)
+    return out
+
+@st.cache_resource
+def get_visualizer():
+    """Create the visualizer once per session instead of on every rerun."""
+    return PricingVisualizer()
+
+@st.cache_data(ttl=3600)
+def _run_competitor_scenario(_optimizer, base_competitor_price, price_changes, day_of_week, season, is_holiday):
+    """Run (and cache) the competitor price scenario sweep."""
+    new_competitor_prices = [base_competitor_price * (1 + change / 100) for change in price_changes]
+    n_scenarios = len(price_changes)
+
+    batch_results = _optimizer.find_optimal_price_batch(
+        new_competitor_prices,
+        [day_of_week] * n_scenarios,
+        [season] * n_scenarios,
+        [is_holiday] * n_scenarios
+    )
+
+    return pd.DataFrame({
+        'competitor_change': list(price_changes),
+        'competitor_price': batch_results['competitor_price'],
+        'optimal_roomify_price': batch_results['optimal_price'],
+        'max_revenue': batch_results['max_revenue'],
+        'optimal_bookings': batch_results['optimal_bookings']
+    })
+
+@st.cache_data(ttl=3600)
+def _run_seasonal_scenario(_optimizer, seasons, competitor_price, day_of_week):
+    """Run (and cache) the per-season optimization sweep.
+
+    Returns the results plus a pre-formatted display copy so no
+    formatting work happens on reruns.
+    """
+    batch_results = _optimizer.find_optimal_price_batch(
+        [competitor_price] * len(seasons),
+        [day_of_week] * len(seasons),
+        list(seasons),
+        [False] * len(seasons)
+    )
+
+    results_df = pd.DataFrame({
+        'season': list(seasons),
+        'optimal_price': batch_results['optimal_price'],
+        'max_revenue': batch_results['max_revenue'],
+        'optimal_bookings': batch_results['optimal_bookings'],
+        'occupancy': batch_results['occupancy']
+    })
+
+    return results_df, _format_table(results_df)
+
+@st.cache_data(ttl=3600)
+def _run_holiday_scenario(_optimizer, competitor_price, day_of_week, season):
+    """Run (and cache) the holiday vs regular day comparison."""
+    scenario_names = ("Regular Day", "Holiday")
+    batch_results = _optimizer.find_optimal_price_batch(
+        [competitor_price] * 2,
+        [day_of_week] * 2,
+        [season] * 2,
+        [False, True]
+    )
+
+    return pd.DataFrame({
+        'scenario': list(scenario_names),
+        'optimal_price': batch_results['optimal_price'],
+        'max_revenue': batch_results['max_revenue'],
+        'optimal_bookings': batch_results['optimal_bookings'],
+        'occupancy': batch_results['occupancy']
+    })
+
+@st.cache_data(ttl=3600)
+def _run_weekend_scenario(_optimizer, days, competitor_price, season, is_holiday):
+    """Run (and cache) the day-of-week optimization sweep."""
+    batch_results = _optimizer.find_optimal_price_batch(
+        [competitor_price] * len(days),
+        list(days),
+        [season] * len(days),
+        [is_holiday] * len(days)
+    )
+
+    return pd.DataFrame({
+        'day': list(days),
+        'optimal_price': batch_results['optimal_price'],
+        'max_revenue': batch_results['max_revenue'],
+        'optimal_bookings': batch_results['optimal_bookings'],
+        'occupancy': batch_results['occupancy'],
+        'is_weekend': [day in ['Saturday', 'Sunday'] for day in days]
+    })
+
+@st.cache_data
+def _generate_insights(_insights, optimization_result, elasticity_result, base_price):
+    """Generate (and cache) business insights for a given optimization run.
+
+    generate_insights is a pure function of its inputs, so identical
+    simulator runs reuse the cached text instead of recomputing.
+    """
+    return _insights.generate_insights(optimization_result, elasticity_result, base_price)
+
+@st.cache_data
+def _compute_kpis(df, _visualizer):
+    """Compute (and cache) the KPI card values."""
+    return _visualizer.kpi_dashboard(df)
+
+@st.cache_data
+def _data_coverage(df):
+    """Compute (and cache) the data-quality metrics in one fused scan."""
+    summary = coverage_summary(df)
+    if summary is None:
+        # Pandas fallback when DuckDB is not installed
+        summary = {
+            'date_min': df['Date'].min(),
+            'date_max': df['Date'].max(),
+            'avg_occupancy': df['Occupancy_Percentage'].mean(),
+            'price_min': df['Roomify_Price'].min(),
+            'price_max': df['Roomify_Price'].max()
+        }
+    return summary
 
 def main():
     """Main dashboard application."""
-    
+
+    # Styling (injected once per session)
+    _inject_css()
+
     # Header
     st.markdown('<h1 class="main-header">🏨 Roomify Dynamic Pricing Dashboard</h1>', unsafe_allow_html=True)
     st.markdown("**Maximize revenue and occupancy through AI-driven dynamic pricing strategies**")
     
-    # Load data and models
-    df = load_data()
-    predictor, optimizer, insights, metrics = load_models()
+    # Load data and models through one cached pipeline
+    df, predictor, optimizer, insights, metrics = load_app_bundle()
     
     if df is None or predictor is None:
         st.error("Unable to load data or models. Please check your setup.")
@@ -140,8 +333,8 @@ def main():
         ["📊 Global Insights", "🎯 Pricing Simulator", "🔍 Scenario Explorer", "📈 Model Performance"]
     )
     
-    # Initialize visualizer
-    visualizer = PricingVisualizer()
+    # Initialize visualizer (cached across reruns)
+    visualizer = get_visualizer()
     
     if page == "📊 Global Insights":
         show_global_insights(df, visualizer)
@@ -158,70 +351,25 @@ def show_global_insights(df, visualizer):
     
     # KPI Cards
     st.subheader("Key Performance Indicators")
-    kpis = visualizer.kpi_dashboard(df)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <h4>Average Occupancy</h4>
-            <h2>{kpis['Average Occupancy']}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div class="kpi-card">
-            <h4>Average Daily Rate</h4>
-            <h2>{kpis['Average Daily Rate']}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <h4>Total Revenue</h4>
-            <h2>{kpis['Total Revenue']}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div class="kpi-card">
-            <h4>RevPAR</h4>
-            <h2>{kpis['RevPAR']}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class="kpi-card">
-            <h4>Average Daily Revenue</h4>
-            <h2>{kpis['Average Daily Revenue']}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div class="kpi-card">
-            <h4>Revenue Growth</h4>
-            <h2>{kpis['Revenue Growth']}</h2>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    # Charts
-    st.subheader("Occupancy Trend Analysis")
-    fig1, explanation1 = visualizer.occupancy_trend_chart(df)
-    st.plotly_chart(fig1, use_container_width=True)
-    st.markdown(f'<div class="insight-box">{explanation1}</div>', unsafe_allow_html=True)
-    
-    st.subheader("Demand vs Price Relationship")
-    fig2, explanation2 = visualizer.demand_price_curve(df)
-    st.plotly_chart(fig2, use_container_width=True)
-    st.markdown(f'<div class="insight-box">{explanation2}</div>', unsafe_allow_html=True)
+    kpis = _compute_kpis(df, visualizer)
+
+    # Emit all six cards as one markdown payload instead of six round-trips
+    card_order = [
+        'Average Occupancy', 'Total Revenue', 'Average Daily Revenue',
+        'Average Daily Rate', 'RevPAR', 'Revenue Growth'
+    ]
+    cards = "".join(
+        f'<div class="kpi-card"><h4>{name}</h4><h2>{kpis[name]}</h2></div>'
+        for name in card_order
+    )
+    st.markdown(f'<div class="kpi-grid">{cards}</div>', unsafe_allow_html=True)
     
-    st.subheader("Competitive Pricing Analysis")
-    fig3, explanation3 = visualizer.competitive_analysis_chart(df)
-    st.plotly_chart(fig3, use_container_width=True)
-    st.markdown(f'<div class="insight-box">{explanation3}</div>', unsafe_allow_html=True)
+    # Charts - one fused figure instead of three separate Plotly payloads
+    st.subheader("Performance Charts")
+    fig, explanations = visualizer.global_insights_figure(df)
+    st.plotly_chart(fig, use_container_width=True)
+    for explanation in explanations:
+        st.markdown(f'<div class="insight-box">{explanation}</div>', unsafe_allow_html=True)
 
 def show_pricing_simulator(predictor, optimizer, insights, visualizer):
     """Display the dynamic pricing simulator."""
@@ -280,9 +428,9 @@ def show_pricing_simulator(predictor, optimizer, insights, visualizer):
                     base_price, competitor_price, day_of_week, season, is_holiday
                 )
                 
-                # Generate insights
-                business_insights = insights.generate_insights(
-                    optimization_result, elasticity_result, base_price
+                # Generate insights (cached on the optimization inputs)
+                business_insights = _generate_insights(
+                    insights, optimization_result, elasticity_result, base_price
                 )
                 
                 # Store results in session state
@@ -379,6 +527,9 @@ def show_scenario_explorer(predictor, optimizer, insights, visualizer):
 
 def show_competitor_scenario(predictor, optimizer, insights, visualizer):
     """Show competitor price change scenarios."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     st.subheader("Competitor Price Impact Analysis")
     
     base_competitor_price = st.slider(
@@ -402,34 +553,14 @@ def show_competitor_scenario(predictor, optimizer, insights, visualizer):
     is_holiday = False
     
     if st.button("Run Scenario Analysis"):
-        results = []
-        
-        for change in price_changes:
-            new_competitor_price = base_competitor_price * (1 + change / 100)
-            
-            # Find optimal price for this scenario
-            optimization_result = optimizer.find_optimal_price(
-                new_competitor_price, day_of_week, season, is_holiday
-            )
-            
-            results.append({
-                'competitor_change': change,
-                'competitor_price': new_competitor_price,
-                'optimal_roomify_price': optimization_result['optimal_price'],
-                'max_revenue': optimization_result['max_revenue'],
-                'optimal_bookings': optimization_result['optimal_bookings']
-            })
-        
-        results_df = pd.DataFrame(results)
+        results_df = _run_competitor_scenario(
+            optimizer, base_competitor_price, tuple(price_changes),
+            day_of_week, season, is_holiday
+        )
         
         # Display results
         st.subheader("Scenario Results")
-        st.dataframe(results_df.style.format({
-            'competitor_price': '${:.0f}',
-            'optimal_roomify_price': '${:.0f}',
-            'max_revenue': '${:,.0f}',
-            'optimal_bookings': '{:.0f}'
-        }))
+        st.dataframe(_format_table(results_df), hide_index=True)
         
         # Visualization
         fig = make_subplots(
@@ -480,82 +611,31 @@ def show_seasonal_scenario(predictor, optimizer, insights, visualizer):
     """Show seasonal demand shift scenarios."""
     st.subheader("Seasonal Demand Impact Analysis")
     
-    seasons = ["Low", "Medium", "High"]
+    seasons = ("Low", "Medium", "High")
     competitor_price = 150
-    
-    results = []
-    
-    for season in seasons:
-        optimization_result = optimizer.find_optimal_price(
-            competitor_price, "Saturday", season, False
-        )
-        
-        results.append({
-            'season': season,
-            'optimal_price': optimization_result['optimal_price'],
-            'max_revenue': optimization_result['max_revenue'],
-            'optimal_bookings': optimization_result['optimal_bookings'],
-            'occupancy': (optimization_result['optimal_bookings'] / 200) * 100
-        })
-    
-    results_df = pd.DataFrame(results)
-    
-    # Display results
+
+    results_df, display_df = _run_seasonal_scenario(optimizer, seasons, competitor_price, "Saturday")
+
+    # Display results (pre-formatted, no Styler work per rerun)
     st.subheader("Seasonal Comparison")
-    st.dataframe(results_df.style.format({
-        'optimal_price': '${:.0f}',
-        'max_revenue': '${:,.0f}',
-        'optimal_bookings': '{:.0f}',
-        'occupancy': '{:.1f}%'
-    }))
-    
-    # Visualization
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('Optimal Price by Season', 'Revenue by Season', 
-                       'Bookings by Season', 'Occupancy by Season'),
-        specs=[[{"secondary_y": False}, {"secondary_y": False}],
-               [{"secondary_y": False}, {"secondary_y": False}]]
-    )
+    st.dataframe(display_df, hide_index=True)
     
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
-    
-    fig.add_trace(go.Bar(
-        x=results_df['season'],
-        y=results_df['optimal_price'],
-        name='Optimal Price',
-        marker_color=colors
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Bar(
-        x=results_df['season'],
-        y=results_df['max_revenue'],
-        name='Max Revenue',
-        marker_color=colors
-    ), row=1, col=2)
-    
-    fig.add_trace(go.Bar(
-        x=results_df['season'],
-        y=results_df['optimal_bookings'],
-        name='Optimal Bookings',
-        marker_color=colors
-    ), row=2, col=1)
-    
-    fig.add_trace(go.Bar(
-        x=results_df['season'],
-        y=results_df['occupancy'],
-        name='Occupancy %',
-        marker_color=colors
-    ), row=2, col=2)
-    
-    fig.update_layout(
-        title="Seasonal Performance Analysis",
-        template='plotly_white',
-        height=600,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    # Visualization - native Vega-Lite bar charts carry far less payload
+    # than a four-subplot Plotly figure for three bars each
+    st.subheader("Seasonal Performance Analysis")
+    chart_data = results_df.set_index('season')
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.caption("Optimal Price by Season")
+        st.bar_chart(chart_data['optimal_price'])
+        st.caption("Bookings by Season")
+        st.bar_chart(chart_data['optimal_bookings'])
+    with col2:
+        st.caption("Revenue by Season")
+        st.bar_chart(chart_data['max_revenue'])
+        st.caption("Occupancy by Season")
+        st.bar_chart(chart_data['occupancy'])
     
     st.markdown("""
     <div class="insight-box">
@@ -574,40 +654,14 @@ def show_holiday_scenario(predictor, optimizer, insights, visualizer):
     day_of_week = "Friday"
     
     # Compare holiday vs non-holiday
-    scenarios = [
-        {"name": "Regular Day", "is_holiday": False},
-        {"name": "Holiday", "is_holiday": True}
-    ]
-    
-    results = []
-    
-    for scenario in scenarios:
-        optimization_result = optimizer.find_optimal_price(
-            competitor_price, day_of_week, season, scenario["is_holiday"]
-        )
-        
-        results.append({
-            'scenario': scenario["name"],
-            'optimal_price': optimization_result['optimal_price'],
-            'max_revenue': optimization_result['max_revenue'],
-            'optimal_bookings': optimization_result['optimal_bookings'],
-            'occupancy': (optimization_result['optimal_bookings'] / 200) * 100
-        })
-    
-    results_df = pd.DataFrame(results)
+    results_df = _run_holiday_scenario(optimizer, competitor_price, day_of_week, season)
     
     # Display results
     st.subheader("Holiday vs Regular Day Comparison")
-    st.dataframe(results_df.style.format({
-        'optimal_price': '${:.0f}',
-        'max_revenue': '${:,.0f}',
-        'optimal_bookings': '{:.0f}',
-        'occupancy': '{:.1f}%'
-    }))
+    st.dataframe(_format_table(results_df), hide_index=True)
     
-    # Calculate impact
-    holiday_impact = results_df[results_df['scenario'] == 'Holiday'].iloc[0]
-    regular_impact = results_df[results_df['scenario'] == 'Regular Day'].iloc[0]
+    # Calculate impact (scenario order is fixed: regular day first)
+    regular_impact, holiday_impact = results_df.iloc[0], results_df.iloc[1]
     
     price_impact = ((holiday_impact['optimal_price'] - regular_impact['optimal_price']) / regular_impact['optimal_price']) * 100
     revenue_impact = ((holiday_impact['max_revenue'] - regular_impact['max_revenue']) / regular_impact['max_revenue']) * 100
@@ -645,84 +699,43 @@ def show_weekend_scenario(predictor, optimizer, insights, visualizer):
     is_holiday = False
     
     # Compare different days
-    days = ["Monday", "Wednesday", "Friday", "Saturday", "Sunday"]
-    
-    results = []
-    
-    for day in days:
-        optimization_result = optimizer.find_optimal_price(
-            competitor_price, day, season, is_holiday
-        )
-        
-        results.append({
-            'day': day,
-            'optimal_price': optimization_result['optimal_price'],
-            'max_revenue': optimization_result['max_revenue'],
-            'optimal_bookings': optimization_result['optimal_bookings'],
-            'occupancy': (optimization_result['optimal_bookings'] / 200) * 100,
-            'is_weekend': day in ['Saturday', 'Sunday']
-        })
-    
-    results_df = pd.DataFrame(results)
+    days = ("Monday", "Wednesday", "Friday", "Saturday", "Sunday")
+
+    results_df = _run_weekend_scenario(optimizer, days, competitor_price, season, is_holiday)
     
     # Display results
     st.subheader("Day-of-Week Performance")
-    st.dataframe(results_df.style.format({
-        'optimal_price': '${:.0f}',
-        'max_revenue': '${:,.0f}',
-        'optimal_bookings': '{:.0f}',
-        'occupancy': '{:.1f}%'
-    }))
-    
-    # Visualization
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Optimal Price by Day', 'Revenue by Day')
-    )
-    
-    # Color by weekend
-    colors = ['red' if x else 'blue' for x in results_df['is_weekend']]
-    
-    fig.add_trace(go.Bar(
-        x=results_df['day'],
-        y=results_df['optimal_price'],
-        name='Optimal Price',
-        marker_color=colors
-    ), row=1, col=1)
-    
-    fig.add_trace(go.Bar(
-        x=results_df['day'],
-        y=results_df['max_revenue'],
-        name='Max Revenue',
-        marker_color=colors
-    ), row=1, col=2)
-    
-    fig.update_layout(
-        title="Day-of-Week Performance Analysis (Red=Weekend, Blue=Weekday)",
-        template='plotly_white',
-        height=400,
-        showlegend=False
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Weekend vs weekday summary
-    weekend_data = results_df[results_df['is_weekend'] == True]
-    weekday_data = results_df[results_df['is_weekend'] == False]
+    st.dataframe(_format_table(results_df), hide_index=True)
     
+    # Visualization - native Vega-Lite bar charts, colored by day type
+    st.subheader("Day-of-Week Performance Analysis")
+
     col1, col2 = st.columns(2)
+    with col1:
+        st.caption("Optimal Price by Day")
+        st.bar_chart(results_df, x='day', y='optimal_price', color='is_weekend')
+    with col2:
+        st.caption("Revenue by Day")
+        st.bar_chart(results_df, x='day', y='max_revenue', color='is_weekend')
     
+    # Weekend vs weekday summary - one grouped pass instead of two slices
+    day_type_means = results_df.groupby('is_weekend')[['optimal_price', 'max_revenue', 'occupancy']].mean()
+    weekday_avg = day_type_means.loc[False]
+    weekend_avg = day_type_means.loc[True]
+
+    col1, col2 = st.columns(2)
+
     with col1:
         st.subheader("Weekend Average")
-        st.metric("Avg Price", f"${weekend_data['optimal_price'].mean():.0f}")
-        st.metric("Avg Revenue", f"${weekend_data['max_revenue'].mean():,.0f}")
-        st.metric("Avg Occupancy", f"{weekend_data['occupancy'].mean():.1f}%")
-    
+        st.metric("Avg Price", f"${weekend_avg['optimal_price']:.0f}")
+        st.metric("Avg Revenue", f"${weekend_avg['max_revenue']:,.0f}")
+        st.metric("Avg Occupancy", f"{weekend_avg['occupancy']:.1f}%")
+
     with col2:
         st.subheader("Weekday Average")
-        st.metric("Avg Price", f"${weekday_data['optimal_price'].mean():.0f}")
-        st.metric("Avg Revenue", f"${weekday_data['max_revenue'].mean():,.0f}")
-        st.metric("Avg Occupancy", f"{weekday_data['occupancy'].mean():.1f}%")
+        st.metric("Avg Price", f"${weekday_avg['optimal_price']:.0f}")
+        st.metric("Avg Revenue", f"${weekday_avg['max_revenue']:,.0f}")
+        st.metric("Avg Occupancy", f"{weekday_avg['occupancy']:.1f}%")
     
     st.markdown("""
     <div class="insight-box">
@@ -734,6 +747,8 @@ def show_weekend_scenario(predictor, optimizer, insights, visualizer):
 
 def show_model_performance(metrics, df):
     """Display model performance metrics."""
+    import plotly.graph_objects as go
+
     st.markdown('<h2 class="sub-header">📈 Model Performance & Analytics</h2>', unsafe_allow_html=True)
     
     if metrics is None:
@@ -779,22 +794,24 @@ def show_model_performance(metrics, df):
         
         st.plotly_chart(fig, use_container_width=True)
     
-    # Data quality metrics
+    # Data quality metrics - one fused, cached aggregation pass
     st.subheader("Data Quality & Coverage")
-    
+
+    coverage = _data_coverage(df)
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
         st.metric("Total Records", f"{len(df):,}")
-    
+
     with col2:
-        st.metric("Date Range", f"{(df['Date'].max() - df['Date'].min()).days} days")
-    
+        st.metric("Date Range", f"{(coverage['date_max'] - coverage['date_min']).days} days")
+
     with col3:
-        st.metric("Avg Occupancy", f"{df['Occupancy_Percentage'].mean():.1f}%")
-    
+        st.metric("Avg Occupancy", f"{coverage['avg_occupancy']:.1f}%")
+
     with col4:
-        st.metric("Price Range", f"${df['Roomify_Price'].min():.0f} - ${df['Roomify_Price'].max():.0f}")
+        st.metric("Price Range", f"${coverage['price_min']:.0f} - ${coverage['price_max']:.0f}")
     
     # Model insights
     st.subheader("Model Insights")
@@ -3,158 +3,199 @@ Data preparation utilities for Roomify pricing dashboard.
 Generates synthetic but realistic pricing data for hotel revenue optimization.
 """
 
+import os
+
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from utils import data_prep_kernels
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    # Polars is optional - the pandas loaders cover everything
+    POLARS_AVAILABLE = False
+
+# Seasonal calendar by day-of-year (same boundaries every year):
+# Jan 1 - Mar 15 low, Mar 16 - May 31 medium, Jun 1 - Aug 31 high,
+# Sep 1 - Oct 31 medium, Nov 1 - Dec 15 low, Dec 16 - Dec 31 high
+SEASON_BOUNDARIES = np.array([1, 75, 152, 244, 305, 350])
+SEASON_PERIOD_CODES = np.array([0, 1, 2, 1, 0, 2])  # 0=low, 1=medium, 2=high
+SEASON_NAMES = ['Low', 'Medium', 'High']
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
-def generate_synthetic_pricing_data(start_date='2022-01-01', end_date='2023-12-31', seed=42):
+# Major holidays (simplified), kept sorted for searchsorted-style lookups
+HOLIDAYS = np.sort(np.array([
+    '2022-01-01', '2022-07-04', '2022-12-25', '2022-12-31',
+    '2023-01-01', '2023-07-04', '2023-12-25', '2023-12-31',
+    # Add some random holidays
+    '2022-05-30', '2022-09-05', '2022-11-24', '2022-11-25',
+    '2023-05-29', '2023-09-04', '2023-11-23', '2023-11-24'
+], dtype='datetime64[D]'))
+
+def generate_synthetic_pricing_data(start_date='2022-01-01', end_date='2023-12-31', seed=42,
+                                    use_numba=False):
     """
     Generate 2 years of synthetic hotel pricing data with realistic patterns.
-    
+
     Args:
         start_date (str): Start date in YYYY-MM-DD format
         end_date (str): End date in YYYY-MM-DD format
         seed (int): Random seed for reproducibility
-        
+        use_numba (bool): Fill the price/demand series with the parallel
+            Numba kernel instead of the NumPy path. Worthwhile for much
+            longer horizons than the default two years; ignored when
+            Numba is not installed.
+
     Returns:
         pd.DataFrame: Synthetic pricing data
     """
-    np.random.seed(seed)
-    random.seed(seed)
-    
+    # Local PCG64 generator: faster draws than the legacy global
+    # RandomState and no shared mutable state between callers
+    rng = np.random.default_rng(seed)
+
     # Create date range
     date_range = pd.date_range(start=start_date, end=end_date, freq='D')
     n_days = len(date_range)
-    
-    data = []
-    
-    # Define seasonal patterns
-    seasons = {
-        'low': ['2022-01-01', '2022-03-15', '2022-11-01', '2022-12-15'],
-        'medium': ['2022-03-16', '2022-05-31', '2022-09-01', '2022-10-31'],
-        'high': ['2022-06-01', '2022-08-31', '2022-12-16', '2022-12-31'],
-        'low_2023': ['2023-01-01', '2023-03-15', '2023-11-01', '2023-12-15'],
-        'medium_2023': ['2023-03-16', '2023-05-31', '2023-09-01', '2023-10-31'],
-        'high_2023': ['2023-06-01', '2023-08-31', '2023-12-16', '2023-12-31']
-    }
-    
-    # Major holidays (simplified)
-    holidays = [
-        '2022-01-01', '2022-07-04', '2022-12-25', '2022-12-31',
-        '2023-01-01', '2023-07-04', '2023-12-25', '2023-12-31',
-        # Add some random holidays
-        '2022-05-30', '2022-09-05', '2022-11-24', '2022-11-25',
-        '2023-05-29', '2023-09-04', '2023-11-23', '2023-11-24'
-    ]
-    
+
     # Base parameters
     base_competitor_price = 150
     base_roomify_price = 160
     total_rooms = 200  # Hotel capacity
-    
-    for i, date in enumerate(date_range):
-        day_of_week = date.weekday()  # 0=Monday, 6=Sunday
-        is_weekend = day_of_week >= 5
-        date_str = date.strftime('%Y-%m-%d')
-        is_holiday = date_str in holidays
-        
-        # Determine season
-        season = 'low'
-        for season_name, dates in seasons.items():
-            if len(dates) == 4:  # Handle both years
-                if (date >= pd.to_datetime(dates[0]) and date <= pd.to_datetime(dates[1])) or \
-                   (date >= pd.to_datetime(dates[2]) and date <= pd.to_datetime(dates[3])):
-                    season = season_name.replace('_2023', '').replace('_2022', '')
-                    break
-        
-        # Price elasticity parameters
-        if season == 'high':
-            demand_base = 180
-            price_elasticity = -0.8
-            competitor_price_multiplier = 1.3
-            roomify_price_multiplier = 1.25
-        elif season == 'medium':
-            demand_base = 120
-            price_elasticity = -1.2
-            competitor_price_multiplier = 1.1
-            roomify_price_multiplier = 1.15
-        else:  # low season
-            demand_base = 80
-            price_elasticity = -1.5
-            competitor_price_multiplier = 0.9
-            roomify_price_multiplier = 0.95
-        
+
+    # Calendar features for all days at once
+    is_weekend = date_range.weekday.values >= 5
+    is_holiday = np.isin(date_range.values.astype('datetime64[D]'), HOLIDAYS)
+    season_code = SEASON_PERIOD_CODES[
+        np.searchsorted(SEASON_BOUNDARIES, date_range.dayofyear.values, side='right') - 1
+    ]
+
+    # Draw all noise arrays up front so both compute paths consume the
+    # same random stream in the same order
+    competitor_noise = rng.normal(0, 15, n_days)
+    roomify_noise = rng.normal(0, 20, n_days)
+    demand_noise = rng.normal(0, 20, n_days)
+    booking_noise = rng.normal(0, 0.1, n_days)
+
+    if use_numba and data_prep_kernels.NUMBA_AVAILABLE:
+        # Parallel elementwise kernel - scales across cores on long horizons
+        competitor_price = np.empty(n_days)
+        roomify_price = np.empty(n_days)
+        demand = np.empty(n_days)
+        bookings = np.empty(n_days)
+        occupancy = np.empty(n_days)
+        data_prep_kernels.fill_pricing_series(
+            is_weekend, is_holiday, season_code,
+            competitor_noise, roomify_noise, demand_noise, booking_noise,
+            float(base_competitor_price), float(base_roomify_price), float(total_rooms),
+            competitor_price, roomify_price, demand, bookings, occupancy
+        )
+    else:
+        # Price elasticity parameters, indexed by season code (low/medium/high)
+        demand_base = np.array([80.0, 120.0, 180.0])[season_code]
+        competitor_price_multiplier = np.array([0.9, 1.1, 1.3])[season_code]
+        roomify_price_multiplier = np.array([0.95, 1.15, 1.25])[season_code]
+
         # Weekend and holiday adjustments
-        weekend_multiplier = 1.4 if is_weekend else 1.0
-        holiday_multiplier = 1.6 if is_holiday else 1.0
-        
-        # Generate competitor price with some randomness
-        competitor_price = base_competitor_price * competitor_price_multiplier
-        competitor_price += np.random.normal(0, 15)  # Add noise
-        competitor_price = max(80, competitor_price)  # Minimum price
-        
-        # Roomify price (usually higher than competitor)
-        roomify_price = base_roomify_price * roomify_price_multiplier
-        roomify_price += np.random.normal(0, 20)
-        roomify_price = max(90, roomify_price)
-        
+        weekend_multiplier = np.where(is_weekend, 1.4, 1.0)
+        holiday_multiplier = np.where(is_holiday, 1.6, 1.0)
+
+        # Generate competitor prices with some randomness
+        competitor_price = base_competitor_price * competitor_price_multiplier + competitor_noise
+        competitor_price = np.maximum(80, competitor_price)  # Minimum price
+
+        # Roomify prices (usually higher than competitor)
+        roomify_price = base_roomify_price * roomify_price_multiplier + roomify_noise
+        roomify_price = np.maximum(90, roomify_price)
+
         # Ensure Roomify stays competitive (not too far from competitor)
-        if roomify_price > competitor_price * 1.5:
-            roomify_price = competitor_price * 1.4
-        elif roomify_price < competitor_price * 0.8:
-            roomify_price = competitor_price * 0.9
-        
+        roomify_price = np.where(
+            roomify_price > competitor_price * 1.5, competitor_price * 1.4,
+            np.where(roomify_price < competitor_price * 0.8, competitor_price * 0.9, roomify_price)
+        )
+
         # Calculate demand based on price elasticity
-        price_ratio = roomify_price / competitor_price
         demand = demand_base * weekend_multiplier * holiday_multiplier
-        
-        # Apply price elasticity effect
-        if roomify_price > competitor_price:
-            price_penalty = (roomify_price - competitor_price) / competitor_price
-            demand *= (1 - price_penalty * 0.3)  # Reduce demand if price is much higher
-        
+
+        # Apply price elasticity effect: reduce demand if price is much higher
+        price_penalty = (roomify_price - competitor_price) / competitor_price
+        demand = np.where(roomify_price > competitor_price, demand * (1 - price_penalty * 0.3), demand)
+
         # Add some randomness to demand
-        demand += np.random.normal(0, 20)
-        demand = max(0, demand)
-        
+        demand = np.maximum(0, demand + demand_noise)
+
         # Calculate occupancy
-        occupancy = min(100, (demand / total_rooms) * 100)
-        
+        occupancy = np.minimum(100, (demand / total_rooms) * 100)
+
         # Add some correlation between demand and actual bookings
-        booking_rate = 0.85 + np.random.normal(0, 0.1)  # 85% booking rate with noise
+        booking_rate = 0.85 + booking_noise  # 85% booking rate with noise
         bookings = demand * booking_rate
-        
-        data.append({
-            'Date': date,
-            'Day_of_Week': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][day_of_week],
-            'Season': season.title(),
-            'Holiday': 'Yes' if is_holiday else 'No',
-            'Competitor_Price': round(competitor_price, 2),
-            'Roomify_Price': round(roomify_price, 2),
-            'Demand': round(demand, 1),
-            'Bookings': round(bookings, 1),
-            'Occupancy_Percentage': round(occupancy, 1),
-            'Total_Rooms': total_rooms,
-            'Revenue': round(roomify_price * bookings, 2),
-            'RevPAR': round((roomify_price * bookings) / total_rooms, 2)  # Revenue per available room
-        })
-    
-    return pd.DataFrame(data)
+
+    revenue = roomify_price * bookings
+
+    # Categorical dtypes keep one string per distinct value plus small
+    # integer codes - less memory than per-row Python strings and faster
+    # to encode downstream
+    return pd.DataFrame({
+        'Date': date_range,
+        'Day_of_Week': pd.Categorical(date_range.day_name(), categories=DAY_NAMES, ordered=True),
+        'Season': pd.Categorical.from_codes(season_code, categories=SEASON_NAMES, ordered=True),
+        'Holiday': pd.Categorical.from_codes(is_holiday.astype(np.int8), categories=['No', 'Yes']),
+        'Competitor_Price': np.round(competitor_price, 2),
+        'Roomify_Price': np.round(roomify_price, 2),
+        'Demand': np.round(demand, 1),
+        'Bookings': np.round(bookings, 1),
+        'Occupancy_Percentage': np.round(occupancy, 1),
+        'Total_Rooms': total_rooms,
+        'Revenue': np.round(revenue, 2),
+        'RevPAR': np.round(revenue / total_rooms, 2)  # Revenue per available room
+    })
 
 def save_dataset(df, filepath='sample_data/pricing_data.csv'):
-    """Save the generated dataset to CSV file."""
+    """Save the generated dataset to Parquet (and CSV for compatibility)."""
     df.to_csv(filepath, index=False)
+    df.to_parquet(filepath.replace('.csv', '.parquet'), engine='pyarrow', compression='zstd')
     print(f"Dataset saved to {filepath}")
     print(f"Shape: {df.shape}")
     print(f"Date range: {df['Date'].min()} to {df['Date'].max()}")
 
-def load_dataset(filepath='sample_data/pricing_data.csv'):
-    """Load the pricing dataset from CSV file."""
-    df = pd.read_csv(filepath)
-    df['Date'] = pd.to_datetime(df['Date'])
+def load_dataset(filepath='sample_data/pricing_data.csv', columns=None):
+    """Load the pricing dataset, preferring the typed Parquet copy.
+
+    Parquet stores columns with their dtypes, so loading skips both the
+    CSV text parse and the string-to-datetime conversion. Falls back to
+    CSV when no Parquet copy exists.
+
+    Args:
+        filepath (str): Path to the CSV copy of the dataset
+        columns (list, optional): Column subset to materialize. Parquet
+            reads only the requested column chunks from disk, so callers
+            that plot a few series avoid loading the full table.
+    """
+    parquet_path = filepath.replace('.csv', '.parquet')
+    if os.path.exists(parquet_path):
+        return pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+    df = pd.read_csv(filepath, usecols=columns)
+    if columns is None or 'Date' in columns:
+        df['Date'] = pd.to_datetime(df['Date'])
     return df
 
+def load_dataset_polars(filepath='sample_data/pricing_data.csv'):
+    """Load the pricing dataset as a Polars DataFrame.
+
+    Polars reads the same Parquet/CSV files with a multithreaded Arrow
+    backend, which makes downstream filter/groupby analytics 2-3x faster
+    than pandas. Callers can convert at the boundary with .to_pandas().
+
+    Raises ImportError when Polars is not installed.
+    """
+    if not POLARS_AVAILABLE:
+        raise ImportError("polars is not installed; use load_dataset instead")
+    parquet_path = filepath.replace('.csv', '.parquet')
+    if os.path.exists(parquet_path):
+        return pl.read_parquet(parquet_path)
+    return pl.read_csv(filepath, try_parse_dates=True)
+
 if __name__ == "__main__":
     # Generate and save the dataset
     df = generate_synthetic_pricing_data()
@@ -0,0 +1,84 @@
+"""
+Optional Numba kernels for the synthetic data generator.
+Fills the price/demand arrays in a parallel loop for large horizons;
+the pure-NumPy path in data_prep remains the default.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - the kernel then runs as a plain Python loop,
+    # but callers only select it when Numba is actually installed
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+@njit(parallel=True, fastmath=True, cache=True)
+def fill_pricing_series(is_weekend, is_holiday, season_code,
+                        competitor_noise, roomify_noise, demand_noise, booking_noise,
+                        base_competitor_price, base_roomify_price, total_rooms,
+                        out_competitor, out_roomify, out_demand, out_bookings, out_occupancy):
+    """Compute prices, demand, bookings and occupancy for every day in parallel.
+
+    Noise arrays are drawn by the caller so the random stream matches the
+    NumPy path; the kernel itself is pure elementwise arithmetic and scales
+    across cores via prange.
+    """
+    n = season_code.shape[0]
+    for i in prange(n):
+        code = season_code[i]
+        if code == 2:
+            demand_base = 180.0
+            competitor_multiplier = 1.3
+            roomify_multiplier = 1.25
+        elif code == 1:
+            demand_base = 120.0
+            competitor_multiplier = 1.1
+            roomify_multiplier = 1.15
+        else:
+            demand_base = 80.0
+            competitor_multiplier = 0.9
+            roomify_multiplier = 0.95
+
+        competitor = base_competitor_price * competitor_multiplier + competitor_noise[i]
+        if competitor < 80.0:
+            competitor = 80.0
+
+        roomify = base_roomify_price * roomify_multiplier + roomify_noise[i]
+        if roomify < 90.0:
+            roomify = 90.0
+        if roomify > competitor * 1.5:
+            roomify = competitor * 1.4
+        elif roomify < competitor * 0.8:
+            roomify = competitor * 0.9
+
+        demand = demand_base
+        if is_weekend[i]:
+            demand *= 1.4
+        if is_holiday[i]:
+            demand *= 1.6
+        if roomify > competitor:
+            price_penalty = (roomify - competitor) / competitor
+            demand *= 1.0 - price_penalty * 0.3
+        demand += demand_noise[i]
+        if demand < 0.0:
+            demand = 0.0
+
+        occupancy = (demand / total_rooms) * 100.0
+        if occupancy > 100.0:
+            occupancy = 100.0
+
+        out_competitor[i] = competitor
+        out_roomify[i] = roomify
+        out_demand[i] = demand
+        out_bookings[i] = demand * (0.85 + booking_noise[i])
+        out_occupancy[i] = occupancy
@@ -0,0 +1,87 @@
+"""
+DuckDB helpers for Roomify pricing dashboard.
+Pushes KPI-style aggregations into DuckDB's vectorized columnar engine
+instead of running multiple pandas passes over the pricing history.
+"""
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    # DuckDB is optional - callers fall back to pandas aggregations
+    DUCKDB_AVAILABLE = False
+
+# Single in-process connection shared across queries
+con = duckdb.connect() if DUCKDB_AVAILABLE else None
+
+KPI_QUERY = """
+SELECT
+    AVG(Occupancy_Percentage) AS avg_occupancy,
+    AVG(Roomify_Price) AS avg_daily_rate,
+    SUM(Revenue) AS total_revenue,
+    AVG(Revenue) AS avg_revenue,
+    AVG(RevPAR) AS revpar,
+    AVG(CASE WHEN rn <= cnt // 2 THEN Revenue END) AS first_half_revenue,
+    AVG(CASE WHEN rn > cnt // 2 THEN Revenue END) AS second_half_revenue
+FROM (
+    SELECT Occupancy_Percentage, Roomify_Price, Revenue, RevPAR,
+           ROW_NUMBER() OVER () AS rn,
+           COUNT(*) OVER () AS cnt
+    FROM pricing
+)
+"""
+
+COVERAGE_QUERY = """
+SELECT
+    MIN(Date) AS date_min,
+    MAX(Date) AS date_max,
+    AVG(Occupancy_Percentage) AS avg_occupancy,
+    MIN(Roomify_Price) AS price_min,
+    MAX(Roomify_Price) AS price_max
+FROM pricing
+"""
+
+def register_pricing(df):
+    """Register the pricing DataFrame as a DuckDB view (zero-copy)."""
+    if con is not None:
+        con.register('pricing', df)
+
+def kpi_summary(df):
+    """Compute the KPI aggregates in a single columnar scan.
+
+    Args:
+        df (pd.DataFrame): Pricing history
+
+    Returns:
+        dict: Raw KPI values keyed by metric name, or None when DuckDB
+            is not installed.
+    """
+    if con is None:
+        return None
+
+    register_pricing(df)
+    result = con.execute(KPI_QUERY).fetchnumpy()
+    return {name: float(values[0]) for name, values in result.items()}
+
+def coverage_summary(df):
+    """Compute the data-quality/coverage aggregates in a single scan.
+
+    Args:
+        df (pd.DataFrame): Pricing history
+
+    Returns:
+        dict: date_min/date_max timestamps plus occupancy and price
+            aggregates, or None when DuckDB is not installed.
+    """
+    if con is None:
+        return None
+
+    register_pricing(df)
+    date_min, date_max, avg_occupancy, price_min, price_max = con.execute(COVERAGE_QUERY).fetchone()
+    return {
+        'date_min': date_min,
+        'date_max': date_max,
+        'avg_occupancy': float(avg_occupancy),
+        'price_min': float(price_min),
+        'price_max': float(price_max)
+    }
@@ -5,7 +5,8 @@ Implements demand curve estimation and revenue maximization algorithms.
 
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.inspection import permutation_importance
 from sklearn.linear_model import LinearRegression
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.model_selection import train_test_split
@@ -13,54 +14,148 @@ from sklearn.metrics import mean_squared_error, r2_score
 import joblib
 import os
 
+try:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+    import onnxruntime as ort
+    ONNX_AVAILABLE = True
+except ImportError:
+    # ONNX export is optional - prediction falls back to sklearn
+    ONNX_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - fall back to the plain-Python kernel
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+@njit(cache=True, fastmath=True)
+def _sweep_revenue(prices, demand, total_rooms):
+    """Cap demand at capacity, compute revenue per price and locate the maximum.
+
+    Compiled with Numba when available so the per-click price sweep runs as
+    native code instead of an interpreted Python loop.
+    """
+    n = prices.shape[0]
+    revenue = np.empty(n)
+    bookings = np.empty(n)
+    best_idx = 0
+    for i in range(n):
+        booked = demand[i] if demand[i] < total_rooms else total_rooms
+        bookings[i] = booked
+        revenue[i] = prices[i] * booked
+        if revenue[i] > revenue[best_idx]:
+            best_idx = i
+    return best_idx, revenue, bookings
+
+def warm_numba_kernels():
+    """Trigger JIT compilation up front so the first user click is fast."""
+    _sweep_revenue(np.array([100.0]), np.array([50.0]), 200.0)
+
 class DemandPredictor:
     """Predicts hotel demand based on pricing and contextual factors."""
     
     def __init__(self):
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+        # Histogram-based gradient boosting has a vectorized native predict
+        # path and far fewer tree evaluations than a 100-tree forest, with
+        # similar accuracy on this tabular data
+        self.model = HistGradientBoostingRegressor(
+            max_iter=200, learning_rate=0.05, max_leaf_nodes=31, random_state=42
+        )
         self.scaler = StandardScaler()
         self.label_encoders = {}
+        self._cat_code_maps = {}
         self.feature_columns = []
         self.is_trained = False
-        
+        self._inference = None
+        self._onnx_bytes = None
+        self._ort_session = None
+
+    def __getstate__(self):
+        # ONNX sessions are not picklable; rebuilt from bytes on load
+        state = self.__dict__.copy()
+        state['_ort_session'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if ONNX_AVAILABLE and self._onnx_bytes is not None:
+            self._ort_session = ort.InferenceSession(
+                self._onnx_bytes, providers=['CPUExecutionProvider']
+            )
+
     def prepare_features(self, df):
-        """Prepare features for model training/prediction."""
-        df_processed = df.copy()
-        
-        # Encode categorical variables
+        """Fit the categorical encoders and build the feature matrix.
+
+        Categorical columns already carry integer codes, so their category
+        order is memoized for predict-time lookups; plain string columns
+        fall back to fitting a LabelEncoder.
+        """
         categorical_cols = ['Day_of_Week', 'Season', 'Holiday']
         for col in categorical_cols:
-            if col not in self.label_encoders:
-                self.label_encoders[col] = LabelEncoder()
-                df_processed[col + '_encoded'] = self.label_encoders[col].fit_transform(df_processed[col])
-            else:
-                df_processed[col + '_encoded'] = self.label_encoders[col].transform(df_processed[col])
-        
-        # Create additional features
-        df_processed['Price_Ratio'] = df_processed['Roomify_Price'] / df_processed['Competitor_Price']
-        df_processed['Price_Difference'] = df_processed['Roomify_Price'] - df_processed['Competitor_Price']
-        df_processed['Is_Weekend'] = df_processed['Day_of_Week'].isin(['Saturday', 'Sunday']).astype(int)
-        df_processed['Is_Holiday'] = (df_processed['Holiday'] == 'Yes').astype(int)
-        
-        # Extract date features
-        df_processed['Month'] = df_processed['Date'].dt.month
-        df_processed['Day_of_Year'] = df_processed['Date'].dt.dayofyear
-        
-        # Define feature columns
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                self._cat_code_maps[col] = {
+                    cls: code for code, cls in enumerate(df[col].cat.categories)
+                }
+            elif col not in self._cat_code_maps and col not in self.label_encoders:
+                self.label_encoders[col] = LabelEncoder().fit(df[col])
+
         self.feature_columns = [
             'Roomify_Price', 'Competitor_Price', 'Price_Ratio', 'Price_Difference',
             'Day_of_Week_encoded', 'Season_encoded', 'Is_Weekend', 'Is_Holiday',
             'Month', 'Day_of_Year'
         ]
-        
-        return df_processed[self.feature_columns]
+
+        return self._features_as_array(df)
+
+    def _encode(self, col, series):
+        """Encode one categorical column with the fitted codes."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.cat.codes.to_numpy()
+        if col in self._cat_code_maps:
+            return series.map(self._cat_code_maps[col]).to_numpy()
+        return self.label_encoders[col].transform(series)
+
+    def _features_as_array(self, df, dtype=np.float64):
+        """Build the (n, 10) feature matrix without copying the DataFrame.
+
+        Fills a single preallocated array straight from the column buffers,
+        avoiding the per-column assignments (and the df.copy they require)
+        of the old DataFrame-based path. Training uses float64; the batch
+        predict path passes float32 for half the memory traffic.
+        """
+        roomify = df['Roomify_Price'].to_numpy(dtype=np.float64)
+        competitor = df['Competitor_Price'].to_numpy(dtype=np.float64)
+
+        # Columns follow self.feature_columns order
+        X = np.empty((len(df), len(self.feature_columns)), dtype=dtype)
+        X[:, 0] = roomify
+        X[:, 1] = competitor
+        X[:, 2] = roomify / competitor
+        X[:, 3] = roomify - competitor
+        X[:, 4] = self._encode('Day_of_Week', df['Day_of_Week'])
+        X[:, 5] = self._encode('Season', df['Season'])
+        X[:, 6] = df['Day_of_Week'].isin(['Saturday', 'Sunday']).to_numpy()
+        X[:, 7] = (df['Holiday'] == 'Yes').to_numpy()
+        X[:, 8] = df['Date'].dt.month.to_numpy()
+        X[:, 9] = df['Date'].dt.dayofyear.to_numpy()
+        return X
     
     def train(self, df):
         """Train the demand prediction model."""
         X = self.prepare_features(df)
         y = df['Demand']
-        
-        # Scale features
+
+        # Scale features (X is a plain array, so the scaler carries no
+        # feature names and accepts NumPy matrices at predict time)
         X_scaled = self.scaler.fit_transform(X)
         
         # Split data
@@ -75,43 +170,154 @@ class DemandPredictor:
         y_pred = self.model.predict(X_test)
         mse = mean_squared_error(y_test, y_pred)
         r2 = r2_score(y_test, y_pred)
+
+        # HistGradientBoosting has no feature_importances_; use permutation
+        # importance on the held-out split instead
+        importance = permutation_importance(
+            self.model, X_test, y_test, n_repeats=5, random_state=42
+        )
         
         self.is_trained = True
-        
+
+        # Freeze everything the hot predict path needs into one bundle of
+        # plain dicts and arrays: category code lookups, the scaler as
+        # affine coefficients, and the feature order. predict_demand_batch
+        # then runs straight-line NumPy with no sklearn transformer calls
+        if 'Day_of_Week' in self._cat_code_maps:
+            dow_codes = dict(self._cat_code_maps['Day_of_Week'])
+            season_codes = dict(self._cat_code_maps['Season'])
+        else:
+            # LabelEncoder codes are positions in the sorted classes_ array
+            dow_codes = {
+                cls: code for code, cls in enumerate(self.label_encoders['Day_of_Week'].classes_)
+            }
+            season_codes = {
+                cls: code for code, cls in enumerate(self.label_encoders['Season'].classes_)
+            }
+        # float32 affine: halves memory traffic in the scaling step and
+        # matches the dtype ONNX Runtime expects (training stays float64)
+        self._inference = {
+            'dow_codes': dow_codes,
+            'season_codes': season_codes,
+            'mean': self.scaler.mean_.astype(np.float32),
+            'inv_scale': (1.0 / self.scaler.scale_).astype(np.float32),
+            'feature_order': list(self.feature_columns)
+        }
+
+        # Export the fitted forest to ONNX when available - ONNX Runtime
+        # evaluates the whole ensemble in one SIMD-vectorized native kernel
+        # instead of sklearn's per-tree dispatch
+        if ONNX_AVAILABLE:
+            try:
+                self._build_onnx_session()
+            except Exception:
+                # Conversion can fail for unsupported model configurations;
+                # prediction then falls back to sklearn
+                self._onnx_bytes = None
+                self._ort_session = None
+
         return {
             'mse': mse,
             'r2': r2,
-            'feature_importance': dict(zip(self.feature_columns, self.model.feature_importances_))
+            'feature_importance': dict(zip(self.feature_columns, importance.importances_mean))
         }
     
+    def _build_onnx_session(self):
+        """Convert the fitted model to ONNX and open a runtime session."""
+        onnx_model = convert_sklearn(
+            self.model,
+            initial_types=[('X', FloatTensorType([None, len(self.feature_columns)]))]
+        )
+        self._onnx_bytes = onnx_model.SerializeToString()
+        self._ort_session = ort.InferenceSession(
+            self._onnx_bytes, providers=['CPUExecutionProvider']
+        )
+
+    def predict(self, X_scaled):
+        """Predict demand from a scaled feature matrix via the fastest backend."""
+        if self._ort_session is not None:
+            X32 = np.ascontiguousarray(X_scaled, dtype=np.float32)
+            return self._ort_session.run(None, {'X': X32})[0].ravel().astype(np.float64)
+        return self.model.predict(X_scaled)
+
     def predict_demand(self, roomify_price, competitor_price, day_of_week, season, is_holiday):
-        """Predict demand for given parameters."""
+        """Predict demand for given parameters.
+
+        Delegates to the batched path with a single-element price array,
+        bypassing the DataFrame/prepare_features pipeline entirely.
+        """
+        return self.predict_demand_batch(
+            np.array([roomify_price], dtype=np.float64),
+            competitor_price, day_of_week, season, is_holiday
+        )[0]
+
+    def predict_demand_batch(self, roomify_prices, competitor_price, day_of_week, season, is_holiday):
+        """Predict demand for many candidate prices in one model call.
+
+        The categorical context is encoded once and broadcast against the
+        price grid, so no per-price DataFrame construction or encoder
+        calls happen.
+
+        Args:
+            roomify_prices: Array of candidate Roomify prices
+            competitor_price (float): Competitor price shared by all candidates
+            day_of_week (str): Day name
+            season (str): Season name
+            is_holiday (bool): Whether the day is a holiday
+
+        Returns:
+            np.ndarray: Predicted demand per candidate price
+        """
         if not self.is_trained:
             raise ValueError("Model must be trained before making predictions")
-        
-        # Create input dataframe
-        input_data = pd.DataFrame({
-            'Date': [pd.Timestamp.now()],
-            'Day_of_Week': [day_of_week],
-            'Season': [season],
-            'Holiday': ['Yes' if is_holiday else 'No'],
-            'Roomify_Price': [roomify_price],
-            'Competitor_Price': [competitor_price],
-            'Demand': [0]  # Placeholder
-        })
-        
-        X = self.prepare_features(input_data)
-        X_scaled = self.scaler.transform(X)
-        
-        return self.model.predict(X_scaled)[0]
+
+        prices = np.asarray(roomify_prices, dtype=np.float64)
+        n_prices = len(prices)
+
+        bundle = self._inference
+        dow_encoded = bundle['dow_codes'][day_of_week]
+        season_encoded = bundle['season_codes'][season]
+        now = pd.Timestamp.now()
+
+        # Columns follow self.feature_columns order; float32 halves the
+        # memory traffic and is what the ONNX session consumes directly
+        X = np.empty((n_prices, len(self.feature_columns)), dtype=np.float32)
+        X[:, 0] = prices                                       # Roomify_Price
+        X[:, 1] = competitor_price                             # Competitor_Price
+        X[:, 2] = prices / competitor_price                    # Price_Ratio
+        X[:, 3] = prices - competitor_price                    # Price_Difference
+        X[:, 4] = dow_encoded                                  # Day_of_Week_encoded
+        X[:, 5] = season_encoded                               # Season_encoded
+        X[:, 6] = int(day_of_week in ('Saturday', 'Sunday'))   # Is_Weekend
+        X[:, 7] = int(is_holiday)                              # Is_Holiday
+        X[:, 8] = now.month                                    # Month
+        X[:, 9] = now.dayofyear                                # Day_of_Year
+
+        # Scale with the precomputed affine - skips sklearn validation
+        X_scaled = (X - bundle['mean']) * bundle['inv_scale']
+        return self.predict(X_scaled)
 
 class RevenueOptimizer:
     """Optimizes pricing to maximize revenue."""
-    
+
+    DEFAULT_PRICE_RANGE = (80, 400)
+    DEFAULT_PRICE_STEP = 5
+
     def __init__(self, demand_predictor):
         self.demand_predictor = demand_predictor
         self.total_rooms = 200
-        
+        # Candidate price grid built once and shared across optimizer calls
+        self._price_grid = np.arange(
+            self.DEFAULT_PRICE_RANGE[0], self.DEFAULT_PRICE_RANGE[1] + 1,
+            self.DEFAULT_PRICE_STEP, dtype=float
+        )
+
+    def _candidate_prices(self, price_range, step):
+        """Return the candidate price grid, reusing the precomputed default."""
+        if price_range == self.DEFAULT_PRICE_RANGE and step == self.DEFAULT_PRICE_STEP:
+            return self._price_grid
+        return np.arange(price_range[0], price_range[1] + 1, step, dtype=float)
+
     def calculate_revenue(self, price, competitor_price, day_of_week, season, is_holiday):
         """Calculate expected revenue for given price."""
         predicted_demand = self.demand_predictor.predict_demand(
@@ -124,68 +330,143 @@ class RevenueOptimizer:
         
         return revenue, bookings, predicted_demand
     
-    def find_optimal_price(self, competitor_price, day_of_week, season, is_holiday, 
-                          price_range=(80, 400), step=5):
-        """Find price that maximizes revenue."""
-        best_price = competitor_price
-        best_revenue = 0
-        best_bookings = 0
-        
-        results = []
-        
-        for price in range(price_range[0], price_range[1] + 1, step):
-            revenue, bookings, demand = self.calculate_revenue(
-                price, competitor_price, day_of_week, season, is_holiday
+    def find_optimal_price(self, competitor_price, day_of_week, season, is_holiday,
+                          price_range=(80, 400), step=5, method='grid'):
+        """Find price that maximizes revenue.
+
+        method='grid' (default) returns the best price on the swept grid.
+        method='brent' additionally runs a bounded scalar optimization in
+        the bracket around the grid optimum, finding the peak to sub-step
+        resolution with only a handful of extra model calls.
+        """
+        prices = self._candidate_prices(price_range, step)
+        demand = self.demand_predictor.predict_demand_batch(
+            prices, competitor_price, day_of_week, season, is_holiday
+        )
+
+        best_idx, revenue, bookings = _sweep_revenue(prices, demand, float(self.total_rooms))
+
+        price_analysis = pd.DataFrame({
+            'price': prices,
+            'revenue': revenue,
+            'bookings': bookings,
+            'demand': demand,
+            'occupancy': (bookings / self.total_rooms) * 100
+        })
+
+        optimal_price = prices[best_idx]
+        max_revenue = revenue[best_idx]
+        optimal_bookings = bookings[best_idx]
+
+        if method == 'brent':
+            from scipy.optimize import minimize_scalar
+
+            def neg_revenue(price):
+                predicted = self.demand_predictor.predict_demand(
+                    price, competitor_price, day_of_week, season, is_holiday
+                )
+                return -price * min(predicted, self.total_rooms)
+
+            # The grid sweep seeds the bracket; the bounded search only
+            # has to resolve the peak within one step either side
+            result = minimize_scalar(
+                neg_revenue,
+                bounds=(max(price_range[0], optimal_price - step),
+                        min(price_range[1], optimal_price + step)),
+                method='bounded', options={'xatol': 1.0}
             )
-            
-            results.append({
-                'price': price,
-                'revenue': revenue,
-                'bookings': bookings,
-                'demand': demand,
-                'occupancy': (bookings / self.total_rooms) * 100
-            })
-            
-            if revenue > best_revenue:
-                best_revenue = revenue
-                best_price = price
-                best_bookings = bookings
-        
+            if -result.fun > max_revenue:
+                optimal_price = float(result.x)
+                max_revenue = float(-result.fun)
+                optimal_bookings = min(max_revenue / optimal_price, float(self.total_rooms))
+
         return {
-            'optimal_price': best_price,
-            'max_revenue': best_revenue,
-            'optimal_bookings': best_bookings,
-            'price_analysis': pd.DataFrame(results)
+            'optimal_price': optimal_price,
+            'max_revenue': max_revenue,
+            'optimal_bookings': optimal_bookings,
+            'price_analysis': price_analysis
         }
     
+    def find_optimal_price_batch(self, competitor_prices, days_of_week, seasons, holidays,
+                                 price_range=(80, 400), step=5):
+        """Find revenue-maximizing prices for many scenarios with one model call.
+
+        Builds a single (n_scenarios x n_prices) feature matrix, runs one
+        batched demand prediction, and selects the argmax-revenue price per
+        scenario. Much faster than calling find_optimal_price in a loop.
+
+        Args:
+            competitor_prices: Sequence of competitor prices, one per scenario
+            days_of_week: Sequence of day names, one per scenario
+            seasons: Sequence of season names, one per scenario
+            holidays: Sequence of booleans, one per scenario
+            price_range (tuple): Min/max candidate price
+            step (int): Price grid step
+
+        Returns:
+            pd.DataFrame: One row per scenario with optimal_price, max_revenue,
+                optimal_bookings and occupancy columns.
+        """
+        competitor_prices = np.asarray(competitor_prices, dtype=float)
+        n_scenarios = len(competitor_prices)
+        prices = self._candidate_prices(price_range, step)
+        n_prices = len(prices)
+
+        # One row per (scenario, candidate price) combination
+        input_data = pd.DataFrame({
+            'Date': pd.Timestamp.now(),
+            'Day_of_Week': np.repeat(np.asarray(days_of_week, dtype=object), n_prices),
+            'Season': np.repeat(np.asarray(seasons, dtype=object), n_prices),
+            'Holiday': np.repeat(np.asarray(['Yes' if h else 'No' for h in holidays], dtype=object), n_prices),
+            'Roomify_Price': np.tile(prices, n_scenarios),
+            'Competitor_Price': np.repeat(competitor_prices, n_prices),
+            'Demand': 0.0  # Placeholder
+        })
+
+        predictor = self.demand_predictor
+        X = predictor._features_as_array(input_data, dtype=np.float32)
+        bundle = predictor._inference
+        X_scaled = (X - bundle['mean']) * bundle['inv_scale']
+        demand = predictor.predict(X_scaled).reshape(n_scenarios, n_prices)
+
+        bookings = np.minimum(demand, self.total_rooms)
+        revenue = prices[np.newaxis, :] * bookings
+        best_idx = revenue.argmax(axis=1)
+        rows = np.arange(n_scenarios)
+
+        return pd.DataFrame({
+            'competitor_price': competitor_prices,
+            'optimal_price': prices[best_idx],
+            'max_revenue': revenue[rows, best_idx],
+            'optimal_bookings': bookings[rows, best_idx],
+            'occupancy': (bookings[rows, best_idx] / self.total_rooms) * 100
+        })
+
     def price_elasticity_analysis(self, base_price, competitor_price, day_of_week, season, is_holiday):
         """Analyze price elasticity around base price."""
-        price_changes = [-20, -15, -10, -5, 0, 5, 10, 15, 20]
-        
-        results = []
-        base_revenue, base_bookings, base_demand = self.calculate_revenue(
-            base_price, competitor_price, day_of_week, season, is_holiday
+        price_changes = np.array([-20, -15, -10, -5, 0, 5, 10, 15, 20], dtype=float)
+        new_prices = base_price * (1 + price_changes / 100)
+
+        # One batched predict for all candidate prices instead of nine
+        # scalar calculate_revenue calls
+        demand = self.demand_predictor.predict_demand_batch(
+            new_prices, competitor_price, day_of_week, season, is_holiday
         )
-        
-        for change in price_changes:
-            new_price = base_price * (1 + change / 100)
-            revenue, bookings, demand = self.calculate_revenue(
-                new_price, competitor_price, day_of_week, season, is_holiday
-            )
-            
-            revenue_change = ((revenue - base_revenue) / base_revenue) * 100
-            booking_change = ((bookings - base_bookings) / base_bookings) * 100
-            
-            results.append({
-                'price_change_pct': change,
-                'new_price': new_price,
-                'revenue_change_pct': revenue_change,
-                'booking_change_pct': booking_change,
-                'revenue': revenue,
-                'bookings': bookings
-            })
-        
-        return pd.DataFrame(results)
+        bookings = np.minimum(demand, self.total_rooms)
+        revenue = new_prices * bookings
+
+        base_idx = np.flatnonzero(price_changes == 0)[0]
+        revenue_change = ((revenue - revenue[base_idx]) / revenue[base_idx]) * 100
+        booking_change = ((bookings - bookings[base_idx]) / bookings[base_idx]) * 100
+
+        return pd.DataFrame({
+            'price_change_pct': price_changes,
+            'new_price': new_prices,
+            'revenue_change_pct': revenue_change,
+            'booking_change_pct': booking_change,
+            'revenue': revenue,
+            'bookings': bookings
+        })
 
 class PricingInsights:
     """Generate business insights from pricing analysis."""
@@ -196,12 +477,13 @@ class PricingInsights:
         optimal_price = optimization_result['optimal_price']
         max_revenue = optimization_result['max_revenue']
         
-        # Calculate current metrics
-        current_revenue = None
-        for _, row in optimization_result['price_analysis'].iterrows():
-            if abs(row['price'] - current_price) < 5:  # Find closest price
-                current_revenue = row['revenue']
-                break
+        # Revenue at the grid price closest to the current price, via a
+        # vectorized lookup instead of an iterrows scan
+        price_analysis = optimization_result['price_analysis']
+        closest = price_analysis.iloc[
+            (price_analysis['price'] - current_price).abs().to_numpy().argmin()
+        ]
+        current_revenue = closest['revenue'] if abs(closest['price'] - current_price) < 5 else None
         
         insights = []
         
@@ -3,107 +3,317 @@ Visualization utilities for Roomify pricing dashboard.
 Creates charts with explanatory text for business insights.
 """
 
+import types
+
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from utils.duck import kpi_summary
+
+try:
+    from plotly_resampler import FigureResampler
+    RESAMPLER_AVAILABLE = True
+except ImportError:
+    # plotly-resampler is optional - time-series charts then ship every point
+    RESAMPLER_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - fall back to the plain-Python kernel
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+@njit(cache=True)
+def _revenue_argmax(prices, revenues):
+    """Locate the revenue-maximizing grid point as native code.
+
+    Replaces the label-based idxmax + .loc lookups, which get expensive
+    once the price grid grows dense.
+    """
+    best = 0
+    for i in range(1, revenues.shape[0]):
+        if revenues[i] > revenues[best]:
+            best = i
+    return prices[best], revenues[best]
+
+OCCUPANCY_TREND_EXPLANATION = """
+**Occupancy Trend Analysis**: This chart shows how occupancy fluctuates over time with clear seasonal patterns.
+Notice the peaks during summer months (High season) and holiday periods, while winter months show lower occupancy.
+Weekend spikes are visible throughout the year, indicating strong leisure demand patterns.
+"""
+
+DEMAND_PRICE_EXPLANATION = """
+**Price Elasticity Analysis**: This scatter plot reveals the inverse relationship between price and demand.
+Higher prices generally lead to lower demand, but the slope varies by season. In high season (red),
+demand remains relatively stable even at higher prices, indicating lower price sensitivity.
+The dashed trend line shows the overall negative correlation between price and demand.
+"""
+
+COMPETITIVE_EXPLANATION = """
+**Competitive Positioning**: This chart tracks Roomify's pricing relative to competitors over time.
+The orange area shows the price premium (positive) or discount (negative) compared to competitors.
+Maintaining a reasonable premium while staying competitive is key to maximizing revenue without losing market share.
+"""
+
+class _LazyStr:
+    """String built on first display rather than at chart-build time.
+
+    Charts whose explanation interpolates computed values return one of
+    these, so callers that only keep the figure never pay for the
+    formatting; st.markdown and f-strings trigger it through str().
+    """
+
+    __slots__ = ('_build', '_value')
+
+    def __init__(self, build):
+        self._build = build
+        self._value = None
+
+    def __str__(self):
+        if self._value is None:
+            self._value = self._build()
+        return self._value
+
+# Immutable shared palette - Streamlit re-instantiates the visualizer on
+# reruns, so the dict is built once at import instead of per instance
+_COLOR_PALETTE = types.MappingProxyType({
+    'primary': '#1f77b4',
+    'secondary': '#ff7f0e',
+    'success': '#2ca02c',
+    'danger': '#d62728',
+    'warning': '#ff7f0e',
+    'info': '#17a2b8'
+})
 
 class PricingVisualizer:
     """Creates visualizations with explanatory text for pricing insights."""
-    
+
+    color_palette = _COLOR_PALETTE
+
     def __init__(self):
-        self.color_palette = {
-            'primary': '#1f77b4',
-            'secondary': '#ff7f0e',
-            'success': '#2ca02c',
-            'danger': '#d62728',
-            'warning': '#ff7f0e',
-            'info': '#17a2b8'
-        }
+        # Figures cached per chart type for in-place data updates
+        self._figs = {}
+        # KPI results keyed by DataFrame fingerprint
+        self._kpi_cache = {}
+        # Hover date strings keyed by data span
+        self._date_str_cache = {}
     
-    def occupancy_trend_chart(self, df, title="Occupancy Trend Over Time"):
-        """Create occupancy trend chart with seasonal patterns."""
-        fig = go.Figure()
-        
-        # Add occupancy line
-        fig.add_trace(go.Scatter(
-            x=df['Date'],
-            y=df['Occupancy_Percentage'],
+    def _plot_view(self, df, cols):
+        """Project the plotted columns and downcast float64 for serialization.
+
+        Plotly JSON-encodes every numeric array it is handed; float32
+        halves that payload versus float64 with no visible difference at
+        chart resolution. Frames already downcast pass through unchanged.
+        """
+        view = df[list(cols)].copy()
+        float_cols = view.select_dtypes(include='float64').columns
+        if len(float_cols):
+            view[float_cols] = view[float_cols].astype(np.float32)
+        return view
+
+    def _date_customdata(self, df):
+        """Return ISO date strings for hover customdata, cached per span.
+
+        pandas strftime is a Python-level loop over Timestamps, so the
+        formatted array is built once per distinct date span and reused
+        across chart calls instead of being reformatted every rerun.
+        """
+        key = (len(df), df['Date'].iloc[0], df['Date'].iloc[-1])
+        dates = self._date_str_cache.get(key)
+        if dates is None:
+            dates = df['Date'].dt.strftime('%Y-%m-%d').to_numpy()
+            if len(self._date_str_cache) >= 16:
+                self._date_str_cache.clear()
+            self._date_str_cache[key] = dates
+        return dates
+
+    def _timeseries_figure(self, data=None, layout=None):
+        """Create a figure for dense time-series traces.
+
+        Traces and layout passed here are validated once in the figure
+        constructor rather than per add_trace/update_layout call. When
+        plotly-resampler is installed the figure LTTB-downsamples each
+        trace to ~2000 shown points, so the browser payload stays
+        O(viewport) no matter how long the history grows.
+        """
+        fig = go.Figure(data=data, layout=layout)
+        if RESAMPLER_AVAILABLE:
+            return FigureResampler(fig, default_n_shown_samples=2000, verbose=False)
+        return fig
+
+    def _occupancy_trace(self, df):
+        """Build the occupancy trend trace from a plot view."""
+        # Scattergl renders the daily series on a WebGL canvas instead of
+        # one SVG node per point, which keeps multi-year data responsive.
+        # Contiguous ndarrays let the orjson encoder serialize through the
+        # buffer protocol instead of boxing each element
+        return go.Scattergl(
+            x=np.ascontiguousarray(df['Date'].to_numpy()),
+            y=np.ascontiguousarray(df['Occupancy_Percentage'].to_numpy()),
             mode='lines',
             name='Occupancy %',
             line=dict(color=self.color_palette['primary'], width=2),
             hovertemplate='<b>%{x|%Y-%m-%d}</b><br>' +
                          'Occupancy: %{y:.1f}%<br>' +
                          '<extra></extra>'
-        ))
-        
-        # Add seasonal background colors
-        seasons = df['Season'].unique()
-        season_colors = {'Low': 'rgba(255,255,255,0.1)', 'Medium': 'rgba(255,165,0,0.1)', 'High': 'rgba(255,0,0,0.1)'}
-        
-        for season in seasons:
-            season_data = df[df['Season'] == season]
-            if not season_data.empty:
-                fig.add_vrect(
-                    x0=season_data['Date'].min(),
-                    x1=season_data['Date'].max(),
-                    fillcolor=season_colors.get(season, 'rgba(128,128,128,0.1)'),
-                    layer="below",
-                    line_width=0,
-                    annotation_text=season,
-                    annotation_position="top left"
-                )
-        
-        fig.update_layout(
-            title=title,
-            xaxis_title="Date",
-            yaxis_title="Occupancy Percentage (%)",
-            hovermode='x unified',
-            template='plotly_white',
-            height=400
         )
-        
-        explanation = """
-        **Occupancy Trend Analysis**: This chart shows how occupancy fluctuates over time with clear seasonal patterns. 
-        Notice the peaks during summer months (High season) and holiday periods, while winter months show lower occupancy. 
-        Weekend spikes are visible throughout the year, indicating strong leisure demand patterns.
+
+    def add_occupancy_trend(self, fig, df, row=None, col=None):
+        """Add the occupancy trend trace and seasonal bands to a figure."""
+        df = self._plot_view(df, ['Date', 'Occupancy_Percentage', 'Season'])
+        fig.add_trace(self._occupancy_trace(df), row=row, col=col)
+        self.add_season_bands(fig, df, row=row, col=col)
+
+    def add_season_bands(self, fig, df, row=None, col=None):
+        """Add the seasonal background bands to a figure.
+
+        Each contiguous seasonal run becomes one rect, and all rects plus
+        their labels are applied in a single layout update - per-band
+        add_vrect calls each revalidate the whole layout, which dominates
+        runtime once subplots are involved.
         """
-        
-        return fig, explanation
-    
-    def demand_price_curve(self, df, title="Demand vs Price Relationship"):
-        """Create demand vs price scatter plot to show elasticity."""
-        fig = go.Figure()
-        
-        # Color by season
-        seasons = df['Season'].unique()
-        colors = ['#1f77b4', '#ff7f0e', '#2ca02c']
-        
-        for i, season in enumerate(seasons):
-            season_data = df[df['Season'] == season]
-            fig.add_trace(go.Scatter(
-                x=season_data['Roomify_Price'],
-                y=season_data['Demand'],
+        season_colors = {'Low': 'rgba(255,255,255,0.1)', 'Medium': 'rgba(255,165,0,0.1)', 'High': 'rgba(255,0,0,0.1)'}
+
+        if row is None:
+            xref, yref = 'x', 'y domain'
+        else:
+            subplot = fig.get_subplot(row, col)
+            xref = subplot.xaxis.plotly_name.replace('axis', '')
+            yref = subplot.yaxis.plotly_name.replace('axis', '') + ' domain'
+
+        season_col = df['Season']
+        seasons = season_col.to_numpy()
+        # Detect run boundaries on the integer category codes when the
+        # column is categorical - int8 comparisons instead of per-element
+        # Python string equality
+        if isinstance(season_col.dtype, pd.CategoricalDtype):
+            season_keys = season_col.cat.codes.to_numpy()
+        else:
+            season_keys = seasons
+        dates = df['Date'].to_numpy()
+        run_starts = np.flatnonzero(np.r_[True, season_keys[1:] != season_keys[:-1]])
+        run_ends = np.r_[run_starts[1:], len(season_keys)] - 1
+
+        shapes = list(fig.layout.shapes or ())
+        annotations = list(fig.layout.annotations or ())
+        for start, end in zip(run_starts, run_ends):
+            season = seasons[start]
+            shapes.append(dict(
+                type='rect', xref=xref, yref=yref,
+                x0=dates[start], x1=dates[end], y0=0, y1=1,
+                fillcolor=season_colors.get(season, 'rgba(128,128,128,0.1)'),
+                layer='below', line=dict(width=0)
+            ))
+            annotations.append(dict(
+                x=dates[start], y=1, xref=xref, yref=yref,
+                text=str(season), showarrow=False,
+                xanchor='left', yanchor='top'
+            ))
+        fig.update_layout(shapes=shapes, annotations=annotations)
+
+    def occupancy_trend_chart(self, df, title="Occupancy Trend Over Time"):
+        """Create occupancy trend chart with seasonal patterns.
+
+        The figure is built once per visualizer and mutated in place on
+        later calls, so the front end diffs the same object instead of
+        destroying and re-instantiating the canvas on every rerun.
+        """
+        fig = None if RESAMPLER_AVAILABLE else self._figs.get('occupancy_trend')
+        if fig is not None:
+            # Update the trace arrays and rebuild the seasonal bands
+            fig.data[0].x = df['Date'].values
+            fig.data[0].y = df['Occupancy_Percentage'].values
+            fig.layout.shapes = ()
+            fig.layout.annotations = ()
+            self.add_season_bands(fig, df)
+            fig.layout.title.text = title
+            return fig, OCCUPANCY_TREND_EXPLANATION
+
+        view = self._plot_view(df, ['Date', 'Occupancy_Percentage', 'Season'])
+        fig = self._timeseries_figure(
+            data=[self._occupancy_trace(view)],
+            layout=dict(
+                title=title,
+                xaxis_title="Date",
+                yaxis_title="Occupancy Percentage (%)",
+                hovermode='x unified',
+                template='plotly_white',
+                height=400
+            )
+        )
+        self.add_season_bands(fig, view)
+
+        # Resampler figures track their own high-frequency state, so only
+        # the plain variant is cached for in-place updates
+        if not RESAMPLER_AVAILABLE:
+            self._figs['occupancy_trend'] = fig
+
+        return fig, OCCUPANCY_TREND_EXPLANATION
+
+    SEASON_MARKER_COLORS = (('Low', '#1f77b4'), ('Medium', '#ff7f0e'), ('High', '#2ca02c'))
+
+    def _demand_price_traces(self, df):
+        """Build the demand/price scatter, legend and trend traces."""
+        df = self._plot_view(df, ['Date', 'Roomify_Price', 'Demand', 'Season'])
+        # One WebGL trace with a numeric season colorscale replaces the
+        # per-season trace loop and its boolean-mask frame copies
+        season_idx = df['Season'].map(
+            {season: idx for idx, (season, _) in enumerate(self.SEASON_MARKER_COLORS)}
+        ).to_numpy(dtype=float)
+
+        traces = [go.Scattergl(
+            x=df['Roomify_Price'].to_numpy(),
+            y=df['Demand'].to_numpy(),
+            mode='markers',
+            name='Demand',
+            showlegend=False,
+            marker=dict(
+                color=season_idx, cmin=0, cmax=2,
+                colorscale=[[0, self.SEASON_MARKER_COLORS[0][1]],
+                            [0.5, self.SEASON_MARKER_COLORS[1][1]],
+                            [1, self.SEASON_MARKER_COLORS[2][1]]],
+                size=8, opacity=0.7
+            ),
+            hovertemplate='<b>%{customdata}</b><br>' +
+                         'Price: $%{x:.0f}<br>' +
+                         'Demand: %{y:.0f} rooms<br>' +
+                         '<extra></extra>',
+            customdata=self._date_customdata(df)
+        )]
+
+        # Empty per-season traces give the legend its entries
+        for season, color in self.SEASON_MARKER_COLORS:
+            traces.append(go.Scattergl(
+                x=[None], y=[None],
                 mode='markers',
                 name=f'{season} Season',
-                marker=dict(color=colors[i % len(colors)], size=8, opacity=0.7),
-                hovertemplate='<b>%{customdata}</b><br>' +
-                             'Price: $%{x:.0f}<br>' +
-                             'Demand: %{y:.0f} rooms<br>' +
-                             '<extra></extra>',
-                customdata=season_data['Date'].dt.strftime('%Y-%m-%d')
+                marker=dict(color=color, size=8, opacity=0.7),
+                hoverinfo='skip'
             ))
-        
-        # Add trend line
-        z = np.polyfit(df['Roomify_Price'], df['Demand'], 1)
-        p = np.poly1d(z)
-        trend_x = np.linspace(df['Roomify_Price'].min(), df['Roomify_Price'].max(), 100)
-        trend_y = p(trend_x)
-        
-        fig.add_trace(go.Scatter(
+
+        # Trend line from the closed-form least-squares slope - one pass
+        # over the columns, no lstsq/SVD design-matrix machinery
+        x = df['Roomify_Price'].to_numpy(dtype=np.float64)
+        y = df['Demand'].to_numpy(dtype=np.float64)
+        x_mean = x.mean()
+        y_mean = y.mean()
+        x_centered = x - x_mean
+        slope = (x_centered * (y - y_mean)).sum() / (x_centered * x_centered).sum()
+        intercept = y_mean - slope * x_mean
+        trend_x = np.linspace(x.min(), x.max(), 100)
+        trend_y = slope * trend_x + intercept
+
+        traces.append(go.Scatter(
             x=trend_x,
             y=trend_y,
             mode='lines',
@@ -111,73 +321,97 @@ class PricingVisualizer:
             line=dict(color='red', width=3, dash='dash'),
             hoverinfo='skip'
         ))
-        
-        fig.update_layout(
-            title=title,
-            xaxis_title="Roomify Price ($)",
-            yaxis_title="Demand (Rooms)",
-            template='plotly_white',
-            height=400
+        return traces
+
+    def add_demand_price(self, fig, df, row=None, col=None):
+        """Add the demand/price scatter and trend line to a figure."""
+        for trace in self._demand_price_traces(df):
+            fig.add_trace(trace, row=row, col=col)
+
+    def demand_price_curve(self, df, title="Demand vs Price Relationship"):
+        """Create demand vs price scatter plot to show elasticity."""
+        # Single-constructor build: traces and layout validate once
+        # instead of per add_trace/update_layout call
+        fig = go.Figure(
+            data=self._demand_price_traces(df),
+            layout=dict(
+                title=title,
+                xaxis_title="Roomify Price ($)",
+                yaxis_title="Demand (Rooms)",
+                template='plotly_white',
+                height=400
+            )
         )
-        
-        explanation = """
-        **Price Elasticity Analysis**: This scatter plot reveals the inverse relationship between price and demand. 
-        Higher prices generally lead to lower demand, but the slope varies by season. In high season (red), 
-        demand remains relatively stable even at higher prices, indicating lower price sensitivity. 
-        The dashed trend line shows the overall negative correlation between price and demand.
-        """
-        
-        return fig, explanation
+
+        return fig, DEMAND_PRICE_EXPLANATION
     
     def revenue_optimization_chart(self, price_analysis_df, current_price=None, title="Revenue Optimization"):
         """Create revenue vs price chart for optimization."""
+        price_analysis_df = self._plot_view(price_analysis_df, ['price', 'revenue', 'occupancy'])
         fig = make_subplots(
             rows=2, cols=1,
             subplot_titles=('Revenue vs Price', 'Occupancy vs Price'),
             vertical_spacing=0.1
         )
         
-        # Revenue chart
-        fig.add_trace(go.Scatter(
-            x=price_analysis_df['price'],
-            y=price_analysis_df['revenue'],
-            mode='lines+markers',
-            name='Revenue',
-            line=dict(color=self.color_palette['success'], width=3),
-            marker=dict(size=6),
-            hovertemplate='<b>Price: $%{x:.0f}</b><br>' +
-                         'Revenue: $%{y:,.0f}<br>' +
-                         '<extra></extra>'
-        ), row=1, col=1)
-        
-        # Occupancy chart
-        fig.add_trace(go.Scatter(
-            x=price_analysis_df['price'],
-            y=price_analysis_df['occupancy'],
-            mode='lines+markers',
-            name='Occupancy',
-            line=dict(color=self.color_palette['primary'], width=3),
-            marker=dict(size=6),
-            hovertemplate='<b>Price: $%{x:.0f}</b><br>' +
-                         'Occupancy: %{y:.1f}%<br>' +
-                         '<extra></extra>'
-        ), row=2, col=1)
-        
-        # Add current price line if provided
+        prices = np.ascontiguousarray(price_analysis_df['price'].to_numpy())
+
+        # Revenue and occupancy traces added in one batched call
+        fig.add_traces([
+            go.Scatter(
+                x=prices,
+                y=np.ascontiguousarray(price_analysis_df['revenue'].to_numpy()),
+                mode='lines+markers',
+                name='Revenue',
+                line=dict(color=self.color_palette['success'], width=3),
+                marker=dict(size=6),
+                hovertemplate='<b>Price: $%{x:.0f}</b><br>' +
+                             'Revenue: $%{y:,.0f}<br>' +
+                             '<extra></extra>'
+            ),
+            go.Scatter(
+                x=prices,
+                y=np.ascontiguousarray(price_analysis_df['occupancy'].to_numpy()),
+                mode='lines+markers',
+                name='Occupancy',
+                line=dict(color=self.color_palette['primary'], width=3),
+                marker=dict(size=6),
+                hovertemplate='<b>Price: $%{x:.0f}</b><br>' +
+                             'Occupancy: %{y:.1f}%<br>' +
+                             '<extra></extra>'
+            )
+        ], rows=[1, 2], cols=[1, 1])
+        
+        # Find the optimal price to highlight
+        optimal_price, optimal_revenue = _revenue_argmax(
+            price_analysis_df['price'].to_numpy(),
+            price_analysis_df['revenue'].to_numpy()
+        )
+
+        # Current and optimal price markers across both subplots, applied
+        # as one batched layout update - every add_vline call revalidates
+        # the whole subplot layout
+        shapes = list(fig.layout.shapes or ())
+        annotations = list(fig.layout.annotations or ())
+
+        def _mark_price(price, dash, color, label):
+            for xref, yref in (('x', 'y domain'), ('x2', 'y2 domain')):
+                shapes.append(dict(
+                    type='line', xref=xref, yref=yref,
+                    x0=price, x1=price, y0=0, y1=1,
+                    line=dict(dash=dash, color=color)
+                ))
+            annotations.append(dict(
+                x=price, y=1, xref='x', yref='y domain',
+                text=label, showarrow=False,
+                xanchor='left', yanchor='bottom'
+            ))
+
         if current_price:
-            fig.add_vline(x=current_price, line_dash="dash", line_color="red", 
-                         annotation_text=f"Current: ${current_price:.0f}", row=1, col=1)
-            fig.add_vline(x=current_price, line_dash="dash", line_color="red", row=2, col=1)
-        
-        # Find and highlight optimal price
-        optimal_idx = price_analysis_df['revenue'].idxmax()
-        optimal_price = price_analysis_df.loc[optimal_idx, 'price']
-        optimal_revenue = price_analysis_df.loc[optimal_idx, 'revenue']
-        
-        fig.add_vline(x=optimal_price, line_dash="dot", line_color="green",
-                     annotation_text=f"Optimal: ${optimal_price:.0f}", row=1, col=1)
-        fig.add_vline(x=optimal_price, line_dash="dot", line_color="green", row=2, col=1)
-        
+            _mark_price(current_price, 'dash', 'red', f"Current: ${current_price:.0f}")
+        _mark_price(optimal_price, 'dot', 'green', f"Optimal: ${optimal_price:.0f}")
+        fig.update_layout(shapes=shapes, annotations=annotations)
+
         fig.update_xaxes(title_text="Price ($)", row=2, col=1)
         fig.update_yaxes(title_text="Revenue ($)", row=1, col=1)
         fig.update_yaxes(title_text="Occupancy (%)", row=2, col=1)
@@ -189,13 +423,13 @@ class PricingVisualizer:
             showlegend=False
         )
         
-        explanation = f"""
-        **Revenue Optimization Analysis**: This chart shows how revenue and occupancy change with different price points. 
-        The optimal price of ${optimal_price:.0f} maximizes revenue at ${optimal_revenue:,.0f}. 
-        Notice that the highest revenue doesn't always coincide with the highest occupancy - 
+        explanation = _LazyStr(lambda: f"""
+        **Revenue Optimization Analysis**: This chart shows how revenue and occupancy change with different price points.
+        The optimal price of ${optimal_price:.0f} maximizes revenue at ${optimal_revenue:,.0f}.
+        Notice that the highest revenue doesn't always coincide with the highest occupancy -
         this demonstrates the trade-off between occupancy and average daily rate (ADR).
-        """
-        
+        """)
+
         return fig, explanation
     
     def price_elasticity_chart(self, elasticity_df, title="Price Elasticity Analysis"):
@@ -206,27 +440,33 @@ class PricingVisualizer:
             horizontal_spacing=0.1
         )
         
-        # Revenue change
-        fig.add_trace(go.Bar(
-            x=elasticity_df['price_change_pct'],
-            y=elasticity_df['revenue_change_pct'],
-            name='Revenue Change %',
-            marker_color=['green' if x > 0 else 'red' for x in elasticity_df['revenue_change_pct']],
-            hovertemplate='<b>Price Change: %{x}%</b><br>' +
-                         'Revenue Change: %{y:.1f}%<br>' +
-                         '<extra></extra>'
-        ), row=1, col=1)
-        
-        # Booking change
-        fig.add_trace(go.Bar(
-            x=elasticity_df['price_change_pct'],
-            y=elasticity_df['booking_change_pct'],
-            name='Booking Change %',
-            marker_color=['blue' if x > 0 else 'orange' for x in elasticity_df['booking_change_pct']],
-            hovertemplate='<b>Price Change: %{x}%</b><br>' +
-                         'Booking Change: %{y:.1f}%<br>' +
-                         '<extra></extra>'
-        ), row=1, col=2)
+        # Bar colors via np.where on the underlying arrays - keeps the
+        # sign test in C instead of a Python list comprehension
+        price_change = elasticity_df['price_change_pct'].to_numpy()
+        revenue_change = elasticity_df['revenue_change_pct'].to_numpy()
+        booking_change = elasticity_df['booking_change_pct'].to_numpy()
+
+        # Revenue and booking bars added in one batched call
+        fig.add_traces([
+            go.Bar(
+                x=price_change,
+                y=revenue_change,
+                name='Revenue Change %',
+                marker_color=np.where(revenue_change > 0, 'green', 'red'),
+                hovertemplate='<b>Price Change: %{x}%</b><br>' +
+                             'Revenue Change: %{y:.1f}%<br>' +
+                             '<extra></extra>'
+            ),
+            go.Bar(
+                x=price_change,
+                y=booking_change,
+                name='Booking Change %',
+                marker_color=np.where(booking_change > 0, 'blue', 'orange'),
+                hovertemplate='<b>Price Change: %{x}%</b><br>' +
+                             'Booking Change: %{y:.1f}%<br>' +
+                             '<extra></extra>'
+            )
+        ], rows=[1, 1], cols=[1, 2])
         
         # Add zero line
         fig.add_hline(y=0, line_dash="dash", line_color="gray", row=1, col=1)
@@ -253,80 +493,167 @@ class PricingVisualizer:
         
         return fig, explanation
     
+    def _competitive_traces(self, df):
+        """Build the competitor, Roomify and price-difference traces."""
+        cols = ['Date', 'Competitor_Price', 'Roomify_Price']
+        has_price_diff = 'Price_Diff' in df.columns
+        if has_price_diff:
+            cols.append('Price_Diff')
+        df = self._plot_view(df, cols)
+        dates = np.ascontiguousarray(df['Date'].to_numpy())
+
+        # Price difference area - precomputed at ingestion when present
+        if has_price_diff:
+            price_diff = df['Price_Diff'].to_numpy()
+        else:
+            price_diff = df['Roomify_Price'].to_numpy() - df['Competitor_Price'].to_numpy()
+
+        # Scattergl keeps the three full-length daily series on one WebGL
+        # canvas instead of tripling the SVG node count; the difference
+        # trace fills against the Roomify trace, so the order matters
+        return [
+            go.Scattergl(
+                x=dates,
+                y=np.ascontiguousarray(df['Competitor_Price'].to_numpy()),
+                mode='lines',
+                name='Competitor Price',
+                line=dict(color=self.color_palette['danger'], width=2),
+                hovertemplate='<b>%{x|%Y-%m-%d}</b><br>' +
+                             'Competitor: $%{y:.0f}<br>' +
+                             '<extra></extra>'
+            ),
+            go.Scattergl(
+                x=dates,
+                y=np.ascontiguousarray(df['Roomify_Price'].to_numpy()),
+                mode='lines',
+                name='Roomify Price',
+                line=dict(color=self.color_palette['primary'], width=2),
+                hovertemplate='<b>%{x|%Y-%m-%d}</b><br>' +
+                             'Roomify: $%{y:.0f}<br>' +
+                             '<extra></extra>'
+            ),
+            go.Scattergl(
+                x=dates,
+                y=price_diff,
+                mode='lines',
+                name='Price Difference',
+                line=dict(color=self.color_palette['warning'], width=2),
+                fill='tonexty',
+                fillcolor='rgba(255,165,0,0.2)',
+                hovertemplate='<b>%{x|%Y-%m-%d}</b><br>' +
+                             'Difference: $%{y:.0f}<br>' +
+                             '<extra></extra>'
+            )
+        ]
+
+    def add_competitive(self, fig, df, row=None, col=None):
+        """Add the competitive pricing traces to a figure."""
+        for trace in self._competitive_traces(df):
+            fig.add_trace(trace, row=row, col=col)
+
     def competitive_analysis_chart(self, df, title="Competitive Pricing Analysis"):
         """Create competitive pricing comparison chart."""
-        fig = go.Figure()
-        
-        # Add competitor price
-        fig.add_trace(go.Scatter(
-            x=df['Date'],
-            y=df['Competitor_Price'],
-            mode='lines',
-            name='Competitor Price',
-            line=dict(color=self.color_palette['danger'], width=2),
-            hovertemplate='<b>%{x|%Y-%m-%d}</b><br>' +
-                         'Competitor: $%{y:.0f}<br>' +
-                         '<extra></extra>'
-        ))
-        
-        # Add Roomify price
-        fig.add_trace(go.Scatter(
-            x=df['Date'],
-            y=df['Roomify_Price'],
-            mode='lines',
-            name='Roomify Price',
-            line=dict(color=self.color_palette['primary'], width=2),
-            hovertemplate='<b>%{x|%Y-%m-%d}</b><br>' +
-                         'Roomify: $%{y:.0f}<br>' +
-                         '<extra></extra>'
-        ))
-        
-        # Add price difference area
-        price_diff = df['Roomify_Price'] - df['Competitor_Price']
-        fig.add_trace(go.Scatter(
-            x=df['Date'],
-            y=price_diff,
-            mode='lines',
-            name='Price Difference',
-            line=dict(color=self.color_palette['warning'], width=2),
-            fill='tonexty',
-            fillcolor='rgba(255,165,0,0.2)',
-            hovertemplate='<b>%{x|%Y-%m-%d}</b><br>' +
-                         'Difference: $%{y:.0f}<br>' +
-                         '<extra></extra>'
-        ))
-        
+        fig = self._timeseries_figure(
+            data=self._competitive_traces(df),
+            layout=dict(
+                title=title,
+                xaxis_title="Date",
+                yaxis_title="Price ($)",
+                template='plotly_white',
+                height=400
+            )
+        )
+
+        return fig, COMPETITIVE_EXPLANATION
+
+    def global_insights_figure(self, df):
+        """Build all three Global Insights charts as one fused figure.
+
+        A single Plotly payload replaces three separate st.plotly_chart
+        calls, cutting frontend instantiation and JSON transport.
+        """
+        fig = make_subplots(
+            rows=3, cols=1,
+            subplot_titles=('Occupancy Trend Over Time',
+                            'Demand vs Price Relationship',
+                            'Competitive Pricing Analysis'),
+            vertical_spacing=0.08
+        )
+
+        self.add_occupancy_trend(fig, df, row=1, col=1)
+        self.add_demand_price(fig, df, row=2, col=1)
+        self.add_competitive(fig, df, row=3, col=1)
+
+        fig.update_xaxes(title_text="Date", row=1, col=1)
+        fig.update_yaxes(title_text="Occupancy Percentage (%)", row=1, col=1)
+        fig.update_xaxes(title_text="Roomify Price ($)", row=2, col=1)
+        fig.update_yaxes(title_text="Demand (Rooms)", row=2, col=1)
+        fig.update_xaxes(title_text="Date", row=3, col=1)
+        fig.update_yaxes(title_text="Price ($)", row=3, col=1)
+
         fig.update_layout(
-            title=title,
-            xaxis_title="Date",
-            yaxis_title="Price ($)",
             template='plotly_white',
-            height=400
+            height=1200,
+            showlegend=False
         )
-        
-        explanation = """
-        **Competitive Positioning**: This chart tracks Roomify's pricing relative to competitors over time. 
-        The orange area shows the price premium (positive) or discount (negative) compared to competitors. 
-        Maintaining a reasonable premium while staying competitive is key to maximizing revenue without losing market share.
-        """
-        
-        return fig, explanation
+
+        explanations = [
+            OCCUPANCY_TREND_EXPLANATION,
+            DEMAND_PRICE_EXPLANATION,
+            COMPETITIVE_EXPLANATION
+        ]
+
+        return fig, explanations
     
     def kpi_dashboard(self, df):
-        """Create KPI summary cards."""
-        # Calculate key metrics
-        avg_occupancy = df['Occupancy_Percentage'].mean()
-        avg_daily_rate = df['Roomify_Price'].mean()
-        total_revenue = df['Revenue'].sum()
-        avg_revenue = df['Revenue'].mean()
-        revpar = df['RevPAR'].mean()
-        
-        # Calculate growth rates (comparing first half vs second half)
-        mid_point = len(df) // 2
-        first_half_revenue = df.iloc[:mid_point]['Revenue'].mean()
-        second_half_revenue = df.iloc[mid_point:]['Revenue'].mean()
+        """Create KPI summary cards.
+
+        Results are memoized on a cheap fingerprint (length, date span,
+        hash of the KPI columns), so reruns over unchanged data cost one
+        hash pass instead of the full set of reductions.
+        """
+        fingerprint = (
+            len(df),
+            df['Date'].iloc[0],
+            df['Date'].iloc[-1],
+            int(pd.util.hash_pandas_object(
+                df[['Revenue', 'Roomify_Price', 'Occupancy_Percentage', 'RevPAR']],
+                index=False
+            ).sum())
+        )
+        cached = self._kpi_cache.get(fingerprint)
+        if cached is not None:
+            return cached
+
+        # Calculate key metrics - one columnar DuckDB scan when available
+        summary = kpi_summary(df)
+
+        if summary is not None:
+            avg_occupancy = summary['avg_occupancy']
+            avg_daily_rate = summary['avg_daily_rate']
+            total_revenue = summary['total_revenue']
+            avg_revenue = summary['avg_revenue']
+            revpar = summary['revpar']
+            first_half_revenue = summary['first_half_revenue']
+            second_half_revenue = summary['second_half_revenue']
+        else:
+            # NumPy fallback when DuckDB is not installed: pull each
+            # column buffer once and derive every aggregate from that
+            # single read instead of seven separate pandas passes
+            revenue = df['Revenue'].to_numpy(dtype=np.float64)
+            avg_occupancy = df['Occupancy_Percentage'].to_numpy().mean()
+            avg_daily_rate = df['Roomify_Price'].to_numpy().mean()
+            total_revenue = revenue.sum()
+            avg_revenue = total_revenue / len(revenue)
+            revpar = df['RevPAR'].to_numpy().mean()
+
+            mid_point = len(revenue) // 2
+            first_half_revenue = revenue[:mid_point].mean()
+            second_half_revenue = revenue[mid_point:].mean()
+
+        # Growth rate compares first half vs second half of the history
         revenue_growth = ((second_half_revenue - first_half_revenue) / first_half_revenue) * 100
-        
+
         kpis = {
             'Average Occupancy': f"{avg_occupancy:.1f}%",
             'Average Daily Rate': f"${avg_daily_rate:.0f}",
@@ -335,7 +662,11 @@ class PricingVisualizer:
             'RevPAR': f"${revpar:.0f}",
             'Revenue Growth': f"{revenue_growth:+.1f}%"
         }
-        
+
+        if len(self._kpi_cache) >= 16:
+            self._kpi_cache.clear()
+        self._kpi_cache[fingerprint] = kpis
+
         return kpis
 
 def create_insight_text(chart_type, data_summary=None):